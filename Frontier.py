@@ -0,0 +1,247 @@
+import os
+import shutil
+import tempfile
+from array import array
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class BucketFrontier:
+    """
+    Open list for integer f-costs.
+
+    Nodes are fixed-width integer records kept in per-(f, h) `array` buckets
+    instead of one Python object per node. Pops take the lowest f, then the
+    lowest h, and are LIFO among records with equal (f, h).
+
+    If `spill_dir` is given and more than `max_resident` records are held in
+    memory, the buckets with the highest f are written to disk and read back
+    once the search reaches them.
+    """
+
+    def __init__(
+        self,
+        record_width: int,
+        typecode: str = "H",
+        spill_dir: Optional[str] = None,
+        max_resident: Optional[int] = None,
+    ):
+        assert record_width > 0, "Record width must be positive."
+        assert spill_dir is None or max_resident, "Spilling needs max_resident."
+
+        self.record_width = record_width
+        self.typecode = typecode
+        self.max_resident = max_resident
+
+        # f -> h -> flat array of records
+        self.buckets: Dict[int, Dict[int, array]] = {}
+        # f -> h -> number of records on disk
+        self.spilled: Dict[int, Dict[int, int]] = {}
+
+        self.resident = 0
+        self.size = 0
+
+        self._spill_dir = (
+            tempfile.mkdtemp(prefix="frontier-", dir=spill_dir) if spill_dir else None
+        )
+
+    def __len__(self):
+        return self.size
+
+    def __bool__(self):
+        return self.size > 0
+
+    @property
+    def min_f(self):
+        keys = [f for f, hs in self.buckets.items() if hs]
+        keys.extend(self.spilled.keys())
+        return min(keys) if keys else None
+
+    def push(self, f: int, h: int, record: Iterable[int]):
+        bucket = self.buckets.setdefault(f, {}).get(h)
+        if bucket is None:
+            bucket = self.buckets[f][h] = array(self.typecode)
+
+        before = len(bucket)
+        bucket.extend(record)
+        assert len(bucket) - before == self.record_width, "Record has wrong width."
+
+        self.resident += 1
+        self.size += 1
+
+        if self._spill_dir and self.resident > self.max_resident:
+            self._spill_cold()
+
+    def pop(self) -> Tuple[int, int, Tuple[int, ...]]:
+        if not self.size:
+            raise IndexError("pop from empty frontier")
+
+        f = self.min_f
+        if f in self.spilled:
+            self._load(f)
+
+        hs = self.buckets[f]
+        h = min(hs)
+        bucket = hs[h]
+
+        w = self.record_width
+        record = tuple(bucket[-w:])
+        del bucket[-w:]
+
+        if not bucket:
+            del hs[h]
+            if not hs:
+                del self.buckets[f]
+
+        self.resident -= 1
+        self.size -= 1
+        return f, h, record
+
+    def clear(self):
+        self.buckets.clear()
+        self.spilled.clear()
+        self.resident = 0
+        self.size = 0
+
+        if self._spill_dir:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            os.makedirs(self._spill_dir)
+
+    def close(self):
+        """
+        Drop all records and remove the spill directory.
+        """
+        self.clear()
+        if self._spill_dir:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def _path(self, f, h):
+        return os.path.join(self._spill_dir, f"f{f}_h{h}.bin")
+
+    def _spill_cold(self):
+        current = self.min_f
+
+        # never spill the bucket the search is about to pop from
+        while self.resident > self.max_resident:
+            cold = [f for f, hs in self.buckets.items() if hs and f != current]
+            if not cold:
+                return
+
+            f = max(cold)
+            counts = self.spilled.setdefault(f, {})
+            for h, bucket in self.buckets.pop(f).items():
+                with open(self._path(f, h), "ab") as file:
+                    bucket.tofile(file)
+
+                n = len(bucket) // self.record_width
+                counts[h] = counts.get(h, 0) + n
+                self.resident -= n
+
+    def _load(self, f):
+        hs = self.buckets.setdefault(f, {})
+
+        for h, n in self.spilled.pop(f).items():
+            path = self._path(f, h)
+            loaded = array(self.typecode)
+            with open(path, "rb") as file:
+                loaded.fromfile(file, n * self.record_width)
+            os.remove(path)
+
+            # spilled records are older, keep them below the resident ones
+            loaded.extend(hs.get(h, array(self.typecode)))
+            hs[h] = loaded
+            self.resident += n
+
+
+class StateStore:
+    """
+    Seen and closed set for a search. Every distinct record gets an integer
+    id; the record, best g, parent id and move code are kept in flat arrays
+    indexed by that id. Lookups go through an open-addressed table of ids,
+    so no Python object is kept per state. The store stays in memory, about
+    2 * record_width + 18 bytes per state; only the frontier spills.
+    """
+
+    def __init__(self, record_width: int, typecode: str = "H"):
+        self.record_width = record_width
+        self.typecode = typecode
+
+        self.records = array(typecode)
+        self.g = array("I")
+        self.parent = array("i")
+        self.move = bytearray()
+        self.closed = bytearray()
+
+        # slot -> id, -1 for empty, kept at most half full
+        self.slots = array("i", [-1]) * 1024
+
+    def __len__(self):
+        return len(self.closed)
+
+    def _find(self, packed: array):
+        """
+        Slot holding `packed`, or the empty slot where it would go.
+        """
+        w = self.record_width
+        mask = len(self.slots) - 1
+        slot = hash(tuple(packed)) & mask
+        while True:
+            i = self.slots[slot]
+            if i < 0 or self.records[i * w : (i + 1) * w] == packed:
+                return slot
+            slot = (slot + 1) & mask
+
+    def _grow(self):
+        w = self.record_width
+        self.slots = array("i", [-1]) * (len(self.slots) * 2)
+        mask = len(self.slots) - 1
+        for i in range(len(self.closed)):
+            slot = hash(tuple(self.records[i * w : (i + 1) * w])) & mask
+            while self.slots[slot] >= 0:
+                slot = (slot + 1) & mask
+            self.slots[slot] = i
+
+    def add(self, record: Iterable[int], g: int, parent: int = -1, move: int = 0):
+        """
+        Insert a record or lower its g. Returns (id, improved); improving a
+        closed record reopens it, so inconsistent heuristics stay optimal.
+        """
+        packed = array(self.typecode, record)
+        assert len(packed) == self.record_width, "Record has wrong width."
+
+        slot = self._find(packed)
+        i = self.slots[slot]
+        if i < 0:
+            i = self.slots[slot] = len(self.closed)
+            self.records.extend(packed)
+            self.g.append(g)
+            self.parent.append(parent)
+            self.move.append(move)
+            self.closed.append(0)
+
+            if 2 * len(self.closed) > len(self.slots):
+                self._grow()
+            return i, True
+
+        if g >= self.g[i]:
+            return i, False
+
+        self.closed[i] = 0
+        self.g[i] = g
+        self.parent[i] = parent
+        self.move[i] = move
+        return i, True
+
+    def record(self, i: int) -> Tuple[int, ...]:
+        w = self.record_width
+        return tuple(self.records[i * w : (i + 1) * w])
+
+    def path(self, i: int):
+        """
+        Move codes from the root to record `i`.
+        """
+        moves = []
+        while self.parent[i] >= 0:
+            moves.append(self.move[i])
+            i = self.parent[i]
+        return moves[::-1]
@@ -0,0 +1,334 @@
+import argparse
+import hashlib
+import importlib
+import json
+import mmap
+import os
+from collections import deque
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Set
+
+PDB_MAGIC = "sokoban-pdb-1"
+UNSOLVED = 255
+
+# same order as Sokoban.DIRECTION_VECTOR: up, down, left, right
+DIRECTIONS = [(-1, 0), (+1, 0), (0, -1), (0, +1)]
+
+
+class Level:
+    """
+    Static part of a level as seen by the pattern database: the cells the
+    player can ever stand on, their neighbours and the targets among them.
+    Tables assume every boulder ends on a target, so levels with spare
+    boulders or targets are rejected.
+    """
+
+    def __init__(self, state):
+        self.m, self.n = state.m, state.n
+
+        boulders = sum(
+            state.has_boulder((i, j)) for i in range(self.m) for j in range(self.n)
+        )
+        if boulders != len(state.targets):
+            raise ValueError(
+                f"Pattern tables need as many boulders as targets, "
+                f"got {boulders} boulders and {len(state.targets)} targets."
+            )
+
+        seen = {state.player}
+        stack = [state.player]
+        while stack:
+            x, y = stack.pop()
+            for dx, dy in DIRECTIONS:
+                cell = (x + dx, y + dy)
+                inside = 0 <= cell[0] < self.m and 0 <= cell[1] < self.n
+                if cell in seen or not inside or state.has_wall(cell):
+                    continue
+                seen.add(cell)
+                stack.append(cell)
+
+        self.cells = sorted(seen)
+        self.index = {cell: i for i, cell in enumerate(self.cells)}
+        self.neighbours: List[List[int]] = [
+            [self.index.get((x + dx, y + dy), -1) for dx, dy in DIRECTIONS]
+            for x, y in self.cells
+        ]
+        self.targets = sorted(
+            self.index[cell] for cell in state.targets if cell in self.index
+        )
+
+        # walls, targets and the interior fix the tables, boulders do not
+        layout = "".join(
+            "#" if state.has_wall((i, j))
+            else "-" if (i, j) not in self.index
+            else "." if state.has_target((i, j))
+            else " "
+            for i in range(self.m)
+            for j in range(self.n)
+        )
+        layout = f"{self.m}x{self.n}:{layout}"
+        self.signature = hashlib.sha1(layout.encode()).hexdigest()
+
+    def reach(self, start: int, occupied: Set[int]):
+        """
+        Cells reachable by the player from `start` without pushing.
+        """
+        region = {start}
+        stack = [start]
+        while stack:
+            for cell in self.neighbours[stack.pop()]:
+                if cell >= 0 and cell not in region and cell not in occupied:
+                    region.add(cell)
+                    stack.append(cell)
+        return region
+
+
+class PatternTable:
+    """
+    Exact push distances for every placement of `size` boulders on a level,
+    with all other boulders removed. Entries are indexed by the rank of the
+    sorted boulder cells and the smallest cell of the player's region.
+    """
+
+    def __init__(self, level: Level, size: int, data):
+        self.level = level
+        self.size = size
+        self.data = data
+        self._mmap = None
+
+    def rank(self, boulders):
+        return sum(comb(cell, i + 1) for i, cell in enumerate(boulders))
+
+    def lookup(self, boulders, player):
+        """
+        Push distance for sorted boulder cells and a player cell, or
+        UNSOLVED if the pattern cannot reach the targets.
+        """
+        cells = len(self.level.cells)
+        rep = min(self.level.reach(player, set(boulders)))
+        return self.data[self.rank(boulders) * cells + rep]
+
+    @classmethod
+    def build(cls, level: Level, size: int):
+        """
+        Retrograde BFS: start from every placement of the boulders on targets
+        and pull them back out, one pull per step.
+        """
+        cells = len(level.cells)
+        table = cls(level, size, bytearray([UNSOLVED]) * (comb(cells, size) * cells))
+        data = table.data
+        queue = deque()
+
+        for goal in combinations(level.targets, size):
+            occupied = set(goal)
+            seen = set()
+            for cell in range(cells):
+                if cell in occupied or cell in seen:
+                    continue
+                region = level.reach(cell, occupied)
+                seen |= region
+
+                key = table.rank(goal) * cells + min(region)
+                if data[key] == UNSOLVED:
+                    data[key] = 0
+                    queue.append((goal, min(region), 0))
+
+        while queue:
+            boulders, rep, dist = queue.popleft()
+            occupied = set(boulders)
+            region = level.reach(rep, occupied)
+
+            for boulder in boulders:
+                for d, player in enumerate(level.neighbours[boulder]):
+                    if player not in region:
+                        continue
+                    behind = level.neighbours[player][d]
+                    if behind < 0 or behind in occupied:
+                        continue
+
+                    pulled = tuple(sorted((occupied - {boulder}) | {player}))
+                    new_rep = min(level.reach(behind, set(pulled)))
+                    key = table.rank(pulled) * cells + new_rep
+                    if data[key] == UNSOLVED:
+                        # saturate below UNSOLVED, still a lower bound
+                        data[key] = min(dist + 1, UNSOLVED - 1)
+                        queue.append((pulled, new_rep, dist + 1))
+
+        return table
+
+    def save(self, path):
+        header = {
+            "magic": PDB_MAGIC,
+            "signature": self.level.signature,
+            "cells": len(self.level.cells),
+            "size": self.size,
+        }
+        with open(path, "wb") as file:
+            file.write(json.dumps(header).encode() + b"\n")
+            file.write(self.data)
+
+    @classmethod
+    def load(cls, level: Level, path):
+        """
+        Map a saved table read-only. Raises ValueError if it was built for
+        a different level or is truncated.
+        """
+        with open(path, "rb") as file:
+            header = json.loads(file.readline())
+            offset = file.tell()
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        cells = len(level.cells)
+        matches = (
+            header.get("magic") == PDB_MAGIC
+            and header.get("signature") == level.signature
+            and header.get("cells") == cells
+        )
+        if not matches:
+            mapped.close()
+            raise ValueError(f"Pattern table {path} does not match this level.")
+
+        entries = len(mapped) - offset
+        expected = comb(cells, header["size"]) * cells
+        if entries != expected:
+            mapped.close()
+            raise ValueError(
+                f"Pattern table {path} has {entries} entries, expected {expected}."
+            )
+
+        table = cls(level, header["size"], memoryview(mapped)[offset:])
+        table._mmap = mapped
+        return table
+
+    def close(self):
+        if self._mmap is not None:
+            self.data.release()
+            self._mmap.close()
+            self._mmap = None
+
+
+class PatternDatabase:
+    """
+    Set of pattern tables for one level. A state's boulders are split into
+    groups of one table size and the group distances summed. "add" uses the
+    largest size; "max" takes the best sum over every size, so each table
+    contributes. Sums are admissible for move costs since each push moves a
+    single boulder and the other boulders are only ever obstacles.
+    """
+
+    def __init__(self, level: Level, tables: Dict[int, PatternTable], combine="add"):
+        assert combine in ("add", "max"), "combine must be 'add' or 'max'."
+        assert tables, "At least one pattern table is required."
+
+        self.level = level
+        self.tables = tables
+        self.combine = combine
+
+    @staticmethod
+    def filename(level: Level, size):
+        return f"pdb-{level.signature[:16]}-{size}.bin"
+
+    @classmethod
+    def build(cls, state, sizes=(1, 2), combine="add"):
+        level = Level(state)
+        tables = {size: PatternTable.build(level, size) for size in sizes}
+        return cls(level, tables, combine)
+
+    @classmethod
+    def load(cls, state, directory, combine="add"):
+        """
+        Load every table previously saved for this level from `directory`.
+        """
+        level = Level(state)
+        tables = {}
+        prefix = f"pdb-{level.signature[:16]}-"
+        for name in os.listdir(directory):
+            if name.startswith(prefix) and name.endswith(".bin"):
+                table = PatternTable.load(level, os.path.join(directory, name))
+                tables[table.size] = table
+
+        if not tables:
+            raise FileNotFoundError(
+                f"No pattern tables for this level in {directory}."
+            )
+        return cls(level, tables, combine)
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        for size, table in self.tables.items():
+            table.save(os.path.join(directory, self.filename(self.level, size)))
+
+    def close(self):
+        for table in self.tables.values():
+            table.close()
+
+    def grouped_sum(self, boulders, player, size):
+        """
+        Sum of distances with the boulders split into groups of `size`. A
+        shorter last group uses the largest table that fits it. None if a
+        group can never be solved.
+        """
+        total = 0
+        for start in range(0, len(boulders), size):
+            group = boulders[start : start + size]
+            while group:
+                fit = max((s for s in self.tables if s <= len(group)), default=None)
+                if fit is None:
+                    break
+
+                value = self.tables[fit].lookup(tuple(group[:fit]), player)
+                if value == UNSOLVED:
+                    return None
+                total += value
+                group = group[fit:]
+        return total
+
+    def estimate(self, state):
+        """
+        Lower bound on the remaining moves, or None if some group of
+        boulders can never be solved.
+        """
+        index = self.level.index
+        boulders = sorted(index[cell] for cell in index if state.has_boulder(cell))
+        player = index[state.player]
+
+        sizes = [max(self.tables)] if self.combine == "add" else sorted(self.tables)
+        values = [self.grouped_sum(boulders, player, size) for size in sizes]
+        if None in values:
+            return None
+        return max(values)
+
+
+def load_description(source):
+    """
+    Level description from a JSON file, or the `description` of a module.
+    """
+    if source.endswith(".json"):
+        with open(source) as file:
+            return json.load(file)
+    return importlib.import_module(source).description
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build pattern tables for a level.")
+    parser.add_argument(
+        "--level",
+        default="Grid",
+        help="JSON file or module with a `description` (default: Grid)",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--out", default="pdb")
+    args = parser.parse_args()
+
+    from Sokoban import make_state
+
+    description = load_description(args.level)
+    database = PatternDatabase.build(make_state(description), args.sizes)
+    database.save(args.out)
+    for size in args.sizes:
+        print(f"size {size}: {PatternDatabase.filename(database.level, size)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 import core
 import os
-import pygame
-from typing import List, Tuple, Set
+from typing import TYPE_CHECKING, List, Tuple, Set
 from Grid import description
+from Frontier import BucketFrontier, StateStore
+
+if TYPE_CHECKING:
+    import pygame
 
 WORKING_DIR = os.path.dirname(os.path.abspath(__file__))
 app_config = {
@@ -190,10 +193,21 @@ def make_state(description):
 
     return SokobanState(logical_board, player, targets)
 
+# flat colours drawn for an asset until its image has finished loading
+PLACEHOLDER_COLORS = {
+    "grass": (96, 160, 72, 255),
+    "target": (220, 200, 80, 255),
+    "player": (60, 90, 200, 255),
+    "boulder": (140, 100, 60, 255),
+    "wall": (90, 90, 90, 255),
+}
+
+
 class SokobanView:
     def __init__(self, cell_len, resource_manager: core.ResourceManager):
         self._cell_len = cell_len
         self.resource_manager = resource_manager
+        self.pygame = core.load_pygame()
 
         assets_dir = os.path.join(WORKING_DIR, "assets")
         assets_path = {
@@ -203,61 +217,82 @@ class SokobanView:
             "target": os.path.join(assets_dir, "target.png"),
             "wall": os.path.join(assets_dir, "wall.png"),
         }
-        
-        self.original_images = {
-            name: self.resource_manager.load_image(name, path, convert_alpha=True)
-            for name, path in assets_path.items()
-        }
-        
-        self.assets = {
-            name: pygame.transform.smoothscale(img, (self.cell_len, self.cell_len))
-            for name, img in self.original_images.items()
-        }
-        
+
+        # images decode in the background, render_view draws placeholders
+        # for whatever is not ready yet
+        for name, path in assets_path.items():
+            self.resource_manager.load_image_async(name, path, convert_alpha=True)
+
+        self.original_images = {}
+        self.assets = {}
+
     @property
     def cell_len(self):
         return self._cell_len
-    
+
     @cell_len.setter
     def cell_len(self, value):
         assert value > 0, "Cell length must be positive."
-        
+
         self._cell_len = value
         self.assets = {
-            name: pygame.transform.smoothscale(img, (self.cell_len, self.cell_len))
-            for name, img in self.original_images.items()
+            name: self.scale(img) for name, img in self.original_images.items()
         }
-    
-        
+
+    def scale(self, img):
+        return self.pygame.transform.smoothscale(img, (self.cell_len, self.cell_len))
+
+    def refresh_assets(self):
+        """
+        Pick up images that finished loading since the last frame.
+        """
+        for name in self.resource_manager.poll():
+            img = self.resource_manager.get("image", name)
+            self.original_images[name] = img
+            self.assets[name] = self.scale(img)
+
+    def draw_asset(self, surface, name, x, y):
+        asset = self.assets.get(name)
+        if asset is not None:
+            surface.blit(asset, (x, y))
+        else:
+            surface.fill(PLACEHOLDER_COLORS[name], (x, y, self.cell_len, self.cell_len))
+
     def render_view(self, state: SokobanState):
+        pygame = self.pygame
+        if self.resource_manager.is_loading():
+            self.refresh_assets()
+
         # m = rows, n = cols
         board_width = state.n * self.cell_len
         board_height = state.m * self.cell_len
-        
+
         board_surface = pygame.Surface((board_width, board_height), pygame.SRCALPHA, 32)
         board_surface.fill((0, 0, 0, 0))
-        
+
         for i, j in generate_indices((state.m, state.n)):
             cell = state.logical_board[i][j]
             x, y = j * self.cell_len, i * self.cell_len
-            
-            board_surface.blit(self.assets["grass"], (x, y))
+
+            self.draw_asset(board_surface, "grass", x, y)
             if cell & MASKS["target"]:
-                board_surface.blit(self.assets["target"], (x, y))
+                self.draw_asset(board_surface, "target", x, y)
             if cell & MASKS["player"]:
-                board_surface.blit(self.assets["player"], (x, y))
+                self.draw_asset(board_surface, "player", x, y)
             if cell & MASKS["boulder"]:
-                board_surface.blit(self.assets["boulder"], (x, y))
+                self.draw_asset(board_surface, "boulder", x, y)
             if cell & MASKS["wall"]:
-                board_surface.blit(self.assets["wall"], (x, y))
-                
+                self.draw_asset(board_surface, "wall", x, y)
+
         return board_surface
 
-def rescale_surface_to_fit(surface: pygame.Surface, shape):
+def rescale_surface_to_fit(surface: "pygame.Surface", shape):
     """
     Rescale the board surface to fit within the given shape (width, height),
     preserving aspect ratio.
     """
+    pygame = core.load_pygame()
+
     if not shape:
         return surface
 
@@ -282,8 +317,143 @@ class Tape:
     pass
 
 
+def pack_state(state: SokobanState):
+    """
+    Encode the dynamic part of a state as flat cell indices:
+    (player, *sorted boulders).
+    """
+    n = state.n
+    boulders = sorted(
+        i * n + j
+        for i, j in generate_indices((state.m, state.n))
+        if state.logical_board[i][j] & MASKS["boulder"]
+    )
+    x, y = state.player
+    return (x * n + y, *boulders)
+
+
+def unpack_state(record, base: SokobanState):
+    """
+    Rebuild a state from a packed record on top of `base`, which holds only
+    the static walls and targets.
+    """
+    n = base.n
+    board = [row.copy() for row in base.logical_board]
+
+    for cell in record[1:]:
+        board[cell // n][cell % n] |= MASKS["boulder"]
+
+    player = divmod(record[0], n)
+    board[player[0]][player[1]] |= MASKS["player"]
+    return SokobanState(board, player, base.targets)
+
+
 class SokobanSolver:
-    pass
+    """
+    A* over player moves. Each state is packed once into a StateStore, which
+    also keeps its best g and parent link; the BucketFrontier only holds
+    (g, state id) records.
+    An optional PatternDatabase tightens the heuristic and prunes states
+    it proves unsolvable; its estimate is not consistent, so closed states
+    are reopened when reached with a lower g.
+    """
+
+    def __init__(
+        self, state: SokobanState, spill_dir=None, max_resident=None, pattern_db=None
+    ):
+        self.start = state
+        self.pattern_db = pattern_db
+
+        dynamic = MASKS["player"] | MASKS["boulder"]
+        self.base = SokobanState(
+            [[cell & ~dynamic for cell in row] for row in state.logical_board],
+            None,
+            state.targets,
+        )
+
+        self.spill_dir = spill_dir
+        self.max_resident = max_resident
+
+    def heuristic(self, state: SokobanState):
+        """
+        Sum over targets of the Manhattan distance to the nearest boulder,
+        raised to the pattern database estimate if one is set. Each target
+        needs its own boulder, so this stays admissible with spare boulders.
+        None marks a dead state.
+        """
+        if not state.targets:
+            return 0
+
+        boulders = [
+            (i, j)
+            for i, j in generate_indices((state.m, state.n))
+            if state.logical_board[i][j] & MASKS["boulder"]
+        ]
+        if len(boulders) < len(state.targets):
+            return None
+
+        total = 0
+        for x, y in state.targets:
+            total += min(abs(i - x) + abs(j - y) for i, j in boulders)
+
+        if self.pattern_db is not None:
+            estimate = self.pattern_db.estimate(state)
+            if estimate is None:
+                return None
+            total = max(total, estimate)
+        return total
+
+    def solve(self):
+        """
+        Return the list of directions solving the level, or None.
+        """
+        h = self.heuristic(self.start)
+        if h is None:
+            return None
+
+        directions = list(DIRECTION_VECTOR)
+        start = pack_state(self.start)
+        store = StateStore(len(start))
+        frontier = BucketFrontier(
+            2,
+            typecode="I",
+            spill_dir=self.spill_dir,
+            max_resident=self.max_resident,
+        )
+
+        root, _ = store.add(start, 0)
+        frontier.push(h, h, (0, root))
+
+        try:
+            while frontier:
+                _, _, (g, i) = frontier.pop()
+                if store.closed[i] or g != store.g[i]:
+                    continue
+                store.closed[i] = 1
+
+                state = unpack_state(store.record(i), self.base)
+                if is_victory(state):
+                    return [directions[move] for move in store.path(i)]
+
+                for move, direction in enumerate(directions):
+                    child = try_move(state, direction)
+                    if child is None:
+                        continue
+
+                    j, improved = store.add(pack_state(child), g + 1, i, move)
+                    if not improved:
+                        continue
+
+                    h = self.heuristic(child)
+                    if h is None:
+                        # dead state, keep it closed so it is not rescored
+                        store.closed[j] = 1
+                        continue
+                    frontier.push(g + 1 + h, h, (g + 1, j))
+        finally:
+            frontier.close()
+
+        return None
 
 class SokobanLayer(core.Layer):
     def __init__(self):
@@ -346,5 +516,6 @@ class Sokoban(core.Application):
         sokoban_layer = SokobanLayer()
         self.layer_stack.push_layer(sokoban_layer)
         
-app = Sokoban()
-core.main(app)
\ No newline at end of file
+if __name__ == "__main__":
+    app = Sokoban()
+    core.main(app)
@@ -1,14 +1,21 @@
 from abc import ABC, abstractmethod
-import pygame
+from typing import TYPE_CHECKING
 from core.EventManager import Event, EventBuffer
 from core.LayerSystem import Layer, LayerStack
 from core.Renderer import Renderer
+from core.LazyPygame import load_pygame
 import core.EventManager as em
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Application(ABC):
     def __init__(self, config: dict):
-        pygame.init()
+        self.pygame = pygame = load_pygame()
+
+        # only the display is used, skip audio/joystick/font start-up
+        pygame.display.init()
 
         self.working_directory = config.get("working_directory", ".")
         self.size = config.get("size", (800, 600))
@@ -32,6 +39,7 @@ class Application(ABC):
         pass
 
     def run(self):
+        pygame = self.pygame
         self.running = True
 
         while self.running:
@@ -62,7 +70,8 @@ class Application(ABC):
     def on_close(self):
         self.running = False
 
-    def map_events(self, event: pygame.event.Event):
+    def map_events(self, event: "pygame.event.Event"):
+        pygame = self.pygame
         if event.type == pygame.QUIT:
             return em.WindowCloseEvent()
         elif event.type == pygame.KEYDOWN:
@@ -0,0 +1,15 @@
+_pygame = None
+
+
+def load_pygame():
+    """
+    Import pygame on first use. Keeping it out of module-level imports lets
+    game logic and solver workers import core without loading pygame.
+    """
+    global _pygame
+
+    if _pygame is None:
+        import pygame
+
+        _pygame = pygame
+    return _pygame
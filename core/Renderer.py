@@ -1,22 +1,27 @@
-import pygame
-from pygame import Surface
+from typing import TYPE_CHECKING
 from core.LayerSystem import LayerStack
+from core.LazyPygame import load_pygame
+
+if TYPE_CHECKING:
+    import pygame
 
 BLACK = (0, 0, 0)
 
 
 class Renderer:
-    def __init__(self, screen: Surface):
+    def __init__(self, screen: "pygame.Surface"):
         self.screen = screen
+        self.pygame = load_pygame()
 
     def clear(self):
         self.screen.fill(BLACK)
 
     def create_surface(self, width, height):
+        pygame = self.pygame
         return pygame.Surface((width, height), pygame.SRCALPHA, 32)
 
-    def submit_surface(self, surface: Surface, x=0, y=0):
+    def submit_surface(self, surface: "pygame.Surface", x=0, y=0):
         self.screen.blit(surface, (x, y))
 
     def show(self):
-        pygame.display.flip()
+        self.pygame.display.flip()
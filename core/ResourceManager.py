@@ -1,35 +1,93 @@
-import pygame
 import os
+from concurrent.futures import ThreadPoolExecutor
+from core.LazyPygame import load_pygame
 
 class ResourceManager:
     def __init__(self):
         self.assets = {
             'image': {}
         }
-        
+        # name -> (future, path, convert_alpha) for images still decoding
+        self.pending = {
+            'image': {}
+        }
+        self._executor = None
+
     def load_image(self, name, path, convert_alpha=True):
         if not os.path.exists(path):
             raise FileNotFoundError(f"Image file {path} not found.")
-        
-        img = pygame.image.load(path)
+
+        img = load_pygame().image.load(path)
         if convert_alpha:
             img = img.convert_alpha()
-            
+
         self.assets['image'][name] = img
         return img
-    
+
+    def load_image_async(self, name, path, convert_alpha=True):
+        """
+        Decode the image on a worker thread. It shows up in the cache
+        once poll() sees it finished.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Image file {path} not found.")
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2)
+
+        future = self._executor.submit(load_pygame().image.load, path)
+        self.pending['image'][name] = (future, path, convert_alpha)
+
+    def poll(self):
+        """
+        Move finished background loads into the cache. convert_alpha needs
+        the display, so it runs here on the calling (main) thread.
+        Returns the names that became available.
+        """
+        ready = []
+        for category, pending in self.pending.items():
+            for name, (future, path, convert_alpha) in list(pending.items()):
+                if not future.done():
+                    continue
+
+                del pending[name]
+                try:
+                    img = future.result()
+                except Exception as error:
+                    raise RuntimeError(
+                        f"Failed to load image '{name}' from {path}."
+                    ) from error
+                if convert_alpha:
+                    img = img.convert_alpha()
+
+                self.assets[category][name] = img
+                ready.append(name)
+        return ready
+
+    def is_loading(self):
+        return any(self.pending.values())
+
     def get(self, category, name):
         return self.assets.get(category, {}).get(name)
-    
+
     def has(self, category, name):
         return name in self.assets.get(category, {})
-    
+
     def unload(self, category, name):
         if self.has(category, name):
             del self.assets[category][name]
-            
+
     def clear(self):
+        for pending in self.pending.values():
+            for future, _, _ in pending.values():
+                future.cancel()
+            pending.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
         for category in self.assets:
             # make list to avoid modifying dict during iteration
-            for name in list(self.assets[category].keys()): 
-                self.unload(category, name)
\ No newline at end of file
+            for name in list(self.assets[category].keys()):
+                self.unload(category, name)
@@ -6,4 +6,5 @@ from core.LayerSystem import Layer, LayerStack
 from core.EventManager import Event, EventDispatcher, EventBuffer
 from core.Renderer import Renderer
 from core.ResourceManager import ResourceManager
-from core.EntryPoint import main
\ No newline at end of file
+from core.EntryPoint import main
+from core.LazyPygame import load_pygame
\ No newline at end of file